@@ -1,7 +1,8 @@
+from functools import cache
 from typing import Dict, Tuple
+from urllib.parse import urlencode
 
 import httpx
-import yt_dlp
 
 
 # from .logging import logging
@@ -10,26 +11,33 @@ import yt_dlp
 # logger = logging.getLogger(__name__)
 
 MIXCLOUD_API_URL = "https://api.mixcloud.com"
+CLOUDCASTS_PAGE_SIZE = 100
+
+
+@cache
+def get_client() -> httpx.Client:
+    return httpx.Client()
 
 
 def search_user_API_url(phrase: str):
-    return f"{MIXCLOUD_API_URL}/search/?q={phrase}&type=user"
+    query = urlencode({"q": phrase, "type": "user"})
+    return f"{MIXCLOUD_API_URL}/search/?{query}"
 
 
 def user_cloudcasts_API_url(username: str):
-    return f"{MIXCLOUD_API_URL}/{username}/cloudcasts/"
+    return f"{MIXCLOUD_API_URL}/{username}/cloudcasts/?limit={CLOUDCASTS_PAGE_SIZE}"
 
 
 def get_mixcloud_API_data(url: str) -> Tuple[Dict, str]:
-    response = None
-    error = ""
     try:
-        req = httpx.get(url=url)
+        req = get_client().get(url=url)
         response = req.json()
     except httpx.RequestError as e:
         error = "Failed to query Mixcloud API"
         # logger.error(msg=f'{error}: {e}', exc_info=True)
+        return {}, error
 
+    error = ""
     if "error" in response:
         error_type = response["error"]["type"]
         error_msg = response["error"]["message"]
@@ -37,9 +45,3 @@ def get_mixcloud_API_data(url: str) -> Tuple[Dict, str]:
         # logger.error(msg=error, exc_info=True)
 
     return response, error
-
-
-def download_cloudcasts(urls, download_dir):
-    ydl_opts = {"outtmpl": f"{download_dir}/%(title)s.%(ext)s"}
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        ydl.download(urls)
@@ -1,5 +1,5 @@
 from os.path import expanduser
-from typing import List
+from typing import Dict, Iterator, List
 
 from PySide6.QtCore import Qt, Slot
 from PySide6.QtWidgets import QFileDialog, QTreeWidget, QTreeWidgetItem
@@ -20,35 +20,40 @@ class CloudcastQTreeWidget(QTreeWidget):
         self.header().resizeSection(1, 400)
         self.header().resizeSection(2, 200)
         self.setHeaderHidden(True)
+        self.setUniformRowHeights(True)
+
+        self.error_dialog = ErrorDialog(self)
 
         self.get_cloudcasts_thread = GetCloudcastsThread()
         self.get_cloudcasts_thread.error_signal.connect(self.show_error)
-        self.get_cloudcasts_thread.new_result.connect(self.add_result)
+        self.get_cloudcasts_thread.new_results.connect(self.add_results)
         self.get_cloudcasts_thread.interrupt_signal.connect(self.clear)
 
+        self.download_items: Dict[str, List[CloudcastQTreeWidgetItem]] = {}
         self.download_thread = DownloadThread()
         self.download_thread.error_signal.connect(self.show_error)
         self.download_thread.progress_signal.connect(self.update_item_download_progress)
 
-    def _get_download_dir(self) -> QFileDialog:
-        dialog = QFileDialog()
-        dialog.setOption(QFileDialog.ShowDirsOnly)
-        dialog.setOption(QFileDialog.DontResolveSymlinks)
-        download_dir = dialog.getExistingDirectory(
-            self, "Select download location", expanduser("~")
+    def _get_download_dir(self) -> str:
+        download_dir = QFileDialog.getExistingDirectory(
+            self,
+            "Select download location",
+            expanduser("~"),
+            QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks,
         )
         return download_dir
 
-    def _get_tree_items(self) -> List[QTreeWidgetItem]:
+    def clear(self) -> None:
+        # the tree items are deleted on the C++ side, so drop our references to them too
+        self.download_items = {}
+        super().clear()
+
+    def _get_tree_items(self) -> Iterator[QTreeWidgetItem]:
         root = self.invisibleRootItem()
-        return [root.child(i) for i in range(root.childCount())]
+        return (root.child(i) for i in range(root.childCount()))
 
     def get_selected_cloudcasts(self) -> List[QTreeWidgetItem]:
-        selected_cloudcasts = []
-        for item in self._get_tree_items():
-            if item.checkState(0) == Qt.Checked:
-                selected_cloudcasts.append(item)
-        return selected_cloudcasts
+        return [item for item in self._get_tree_items() if item.checkState(0) == Qt.Checked]
 
     @Slot(MixcloudUser)
     def get_cloudcasts(self, user: MixcloudUser) -> None:
@@ -61,31 +66,44 @@ class CloudcastQTreeWidget(QTreeWidget):
 
     @Slot()
     def show_error(self, msg: str):
-        ErrorDialog(self.parent(), message=msg)
+        self.error_dialog.showMessage(msg)
+
+    def _set_check_state_all(self, state: Qt.CheckState) -> None:
+        # repaint once after all items are updated instead of once per item
+        self.setUpdatesEnabled(False)
+        try:
+            for item in self._get_tree_items():
+                item.setCheckState(0, state)
+        finally:
+            self.setUpdatesEnabled(True)
 
     @Slot()
     def select_all(self) -> None:
-        for item in self._get_tree_items():
-            item.setCheckState(0, Qt.Checked)
+        self._set_check_state_all(Qt.Checked)
 
     @Slot()
     def unselect_all(self) -> None:
-        for item in self._get_tree_items():
-            item.setCheckState(0, Qt.Unchecked)
+        self._set_check_state_all(Qt.Unchecked)
 
     @Slot()
     def download_selected_cloudcasts(self) -> None:
-        download_dir = self._get_download_dir()
         items = self.get_selected_cloudcasts()
+        if not items:
+            return
 
+        download_dir = self._get_download_dir()
+        self.download_items = {}
+        for item in items:
+            key = f"{item.cloudcast.user.name} - {item.cloudcast.name}".lower()
+            self.download_items.setdefault(key, []).append(item)
         self.download_thread.download_dir = download_dir
         self.download_thread.urls = [item.cloudcast.url for item in items]
         self.download_thread.start()
 
     @Slot()
-    def add_result(self, item: Cloudcast):
-        item = CloudcastQTreeWidgetItem(cloudcast=item)
-        self.addTopLevelItem(item)
+    def add_results(self, cloudcasts: List[Cloudcast]):
+        items = [CloudcastQTreeWidgetItem(cloudcast=cloudcast) for cloudcast in cloudcasts]
+        self.addTopLevelItems(items)
 
     @Slot()
     def cancel_cloudcasts_download(self) -> None:
@@ -93,9 +111,5 @@ class CloudcastQTreeWidget(QTreeWidget):
 
     @Slot()
     def update_item_download_progress(self, name: str, progress: str):
-        for item in self.get_selected_cloudcasts():
-            if (
-                name.lower()
-                == f"{item.cloudcast.user.name.lower()} - {item.cloudcast.name.lower()}"
-            ):
-                item.update_download_progress(progress)
+        for item in self.download_items.get(name.lower(), []):
+            item.update_download_progress(progress)
@@ -1,9 +1,16 @@
+from typing import Optional
+
 from PySide6.QtWidgets import QErrorMessage
 
 
+# Meant to be created once per widget and reused for every error it reports. Reusing the dialog
+# keeps its "Show this message again" checkbox in effect, so a message the user opted out of
+# stays hidden for the rest of the session. Messages are shown without a type, so the opt-out
+# is keyed on the exact text and other errors are still shown.
 class ErrorDialog(QErrorMessage):
-    def __init__(self, parent, message: str, title: str = "Error"):
+    def __init__(self, parent, message: Optional[str] = None, title: str = "Error"):
         super().__init__(parent)
 
         self.setWindowTitle(title)
-        self.showMessage(message)
+        if message:
+            self.showMessage(message)
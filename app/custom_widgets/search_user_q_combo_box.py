@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Optional
 
 from PySide6.QtCore import Qt, QTimer, Slot
 from PySide6.QtWidgets import QComboBox
@@ -13,9 +13,9 @@ class SearchUserQComboBox(QComboBox):
         super().__init__()
 
         self.setEditable(True)
-        self.results: list[MixcloudUser] = []
-        self.selected_result: Any[MixcloudUser, None] = None
+        self.selected_result: Optional[MixcloudUser] = None
         self.search_artist_thread = SearchArtistThread()
+        self.error_dialog = ErrorDialog(self)
 
         self.timer = QTimer()
         self.timer.setInterval(750)
@@ -40,23 +40,17 @@ class SearchUserQComboBox(QComboBox):
 
         if phrase:
             self.clear()
-            self.results.clear()
 
             self.search_artist_thread.phrase = phrase
             self.search_artist_thread.start()
 
     @Slot()
     def show_error(self, msg: str):
-        ErrorDialog(self, message=msg)
+        self.error_dialog.showMessage(msg)
 
     @Slot()
     def add_result(self, item: MixcloudUser):
-        self.results.append(item)
-
-        if len(self.results) == 1:
-            self.set_selected_result(index=0)
-
-        self.addItem(f"{item.name} ({item.username})")
+        self.addItem(f"{item.name} ({item.username})", item)
 
     @Slot(int)
     def on_index_changed(self, index: int):
@@ -64,4 +58,4 @@ class SearchUserQComboBox(QComboBox):
 
     @Slot(MixcloudUser)
     def set_selected_result(self, index: int):
-        self.selected_result = self.results[index]
+        self.selected_result = self.itemData(index)
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Dict
 
 
-@dataclass()
+@dataclass(slots=True)
 class MixcloudUser:
     key: str
     name: str
@@ -11,7 +11,7 @@ class MixcloudUser:
     username: str
 
 
-@dataclass()
+@dataclass(slots=True)
 class Cloudcast:
     name: str
     url: str
@@ -1,6 +1,8 @@
-from typing import List
+import os
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 
-import yt_dlp
 from PySide6.QtCore import QThread, Signal
 
 from .api import get_mixcloud_API_data, search_user_API_url, user_cloudcasts_API_url
@@ -12,6 +14,10 @@ from .data_classes import Cloudcast, MixcloudUser
 
 # logger = logging.getLogger(__name__)
 
+PROGRESS_UPDATE_INTERVAL = 0.25  # seconds
+SEARCH_RESULTS_TTL = 300  # seconds
+SEARCH_RESULTS_CACHE_SIZE = 100
+
 
 class DownloadThread(QThread):
     urls: List[str] = []
@@ -21,10 +27,19 @@ class DownloadThread(QThread):
     interrupt_signal = Signal()
     error_signal = Signal(object)
 
+    _last_progress_update: float = 0.0
+
     def _track_progress(self, d):
-        item_name = (
-            d["filename"].replace(f"{self.download_dir}/", "").replace(".m4a", "").replace("_", "/")
-        )
+        if d["status"] == "downloading":
+            # yt-dlp calls this hook for every downloaded chunk; only forward it to the GUI
+            # thread a few times per second
+            now = time.monotonic()
+            if now - self._last_progress_update < PROGRESS_UPDATE_INTERVAL:
+                return
+            self._last_progress_update = now
+
+        basename = os.path.basename(d["filename"])
+        item_name = os.path.splitext(basename)[0].replace("_", "/")
 
         progress = "unknown"
         if d["status"] == "downloading":
@@ -43,6 +58,9 @@ class DownloadThread(QThread):
             self.error_signal.emit(error_msg)
             return
 
+        # yt-dlp is slow to import and only needed once a download starts
+        import yt_dlp
+
         ydl_opts = {
             "outtmpl": f"{self.download_dir}/%(uploader)s - %(title)s.%(ext)s",
             "progress_hooks": [self._track_progress],
@@ -62,33 +80,31 @@ class DownloadThread(QThread):
 class GetCloudcastsThread(QThread):
     error_signal = Signal(object)
     interrupt_signal = Signal()
-    new_result = Signal(Cloudcast)
+    new_results = Signal(list)
 
     user: MixcloudUser = None
 
-    def _query_cloudcasts(self, user: MixcloudUser, url: str = ""):
-        if not url:
-            url = user_cloudcasts_API_url(username=user.username)
+    def _query_cloudcasts(self, user: MixcloudUser):
+        url = user_cloudcasts_API_url(username=user.username)
 
-        response, error = get_mixcloud_API_data(url=url)
-        if error:
-            self.error_signal.emit(error)
-            self.stop()
-            return
+        while url and not self.isInterruptionRequested():
+            response, error = get_mixcloud_API_data(url=url)
+            if error:
+                self.error_signal.emit(error)
+                self.stop()
+                return
 
-        while not self.isInterruptionRequested():
-            for cloudcast in response["data"]:
-                cloudcast = Cloudcast(
+            cloudcasts = [
+                Cloudcast(
                     name=cloudcast["name"],
                     url=cloudcast["url"],
                     user=user,
                 )
-                self.new_result.emit(cloudcast)
+                for cloudcast in response["data"]
+            ]
+            self.new_results.emit(cloudcasts)
 
-            if response.get("paging") and response["paging"].get("next"):
-                next_url = response["paging"].get("next")
-                self._query_cloudcasts(user=user, url=next_url)
-            return
+            url = response.get("paging", {}).get("next")
 
     def run(self) -> None:
         # logger.debug('get_cloudcasts_thread started')
@@ -96,9 +112,9 @@ class GetCloudcastsThread(QThread):
             error_msg = "no user provided"
             # logger.error(error_msg)
             self.error_signal.emit(error_msg)
+            return
 
         self._query_cloudcasts(user=self.user)
-        return
 
     def stop(self):
         # logger.debug("Thread Stopped")
@@ -113,28 +129,56 @@ class SearchArtistThread(QThread):
 
     phrase: str = ""
 
+    def __init__(self):
+        super().__init__()
+
+        self.results_cache: OrderedDict[str, Tuple[float, List[MixcloudUser]]] = OrderedDict()
+
+    def _get_cached_results(self, phrase: str) -> Optional[List[MixcloudUser]]:
+        cached = self.results_cache.get(phrase)
+        if cached is None:
+            return None
+
+        cached_at, users = cached
+        if time.monotonic() - cached_at > SEARCH_RESULTS_TTL:
+            del self.results_cache[phrase]
+            return None
+
+        self.results_cache.move_to_end(phrase)
+        return users
+
+    def _cache_results(self, phrase: str, users: List[MixcloudUser]) -> None:
+        self.results_cache[phrase] = (time.monotonic(), users)
+        self.results_cache.move_to_end(phrase)
+        if len(self.results_cache) > SEARCH_RESULTS_CACHE_SIZE:
+            self.results_cache.popitem(last=False)
+
     def show_suggestions(self, phrase: str) -> None:
-        url = search_user_API_url(phrase=phrase)
-        response, error = get_mixcloud_API_data(url=url)
-        if error:
-            self.error_signal.emit(error)
-            self.stop()
-        else:
-            for i, result in enumerate(response["data"]):
-                user = MixcloudUser(**result)
-                self.new_result.emit(user)
+        users = self._get_cached_results(phrase)
+        if users is None:
+            url = search_user_API_url(phrase=phrase)
+            response, error = get_mixcloud_API_data(url=url)
+            if error:
+                self.error_signal.emit(error)
+                self.stop()
+                return
+
+            users = [MixcloudUser(**result) for result in response["data"]]
+            self._cache_results(phrase=phrase, users=users)
+
+        for user in users:
+            self.new_result.emit(user)
 
     def run(self) -> None:
         # logger.debug('thread started')
-        while not self.isInterruptionRequested():
-            if not self.phrase:
-                error_msg = "no search phrase provided"
-                # logger.error(error_msg)
-                self.error_signal.emit(error_msg)
-
-            self.show_suggestions(phrase=self.phrase)
+        if not self.phrase:
+            error_msg = "no search phrase provided"
+            # logger.error(error_msg)
+            self.error_signal.emit(error_msg)
             return
 
+        self.show_suggestions(phrase=self.phrase)
+
     def stop(self):
         # logger.debug("thread Stopped")
         self.requestInterruption()